@@ -1,14 +1,24 @@
+import argparse
+import ast
 import json
-import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
+from functools import partial
+from io import BytesIO
 from pathlib import Path
 from typing import Any
+from typing import BinaryIO
 from typing import Sequence
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Case:
     """Test case dataclass to help with table driven tests."""
 
@@ -23,75 +33,135 @@ class Case:
     future: bool = False
 
 
-@dataclass
-class NewCase:
-    """Test helper class."""
-
-    name: str
-    template: str
-    data: dict[str, Any] = field(default_factory=dict)
-    templates: dict[str, str] | None = None
-    result: str | None = None
-    invalid: bool | None = None
-    tags: list[str] = field(default_factory=list)
-
-
-def migrate_one(old: Case) -> NewCase:
-    if old.error:
-        return NewCase(
-            name=old.description,
-            template=old.template,
-            templates=old.partials,
-            data=old.globals,
-            invalid=old.error,
-        )
-    return NewCase(
-        name=old.description,
-        template=old.template,
-        data=old.globals,
-        templates=old.partials,
-        result=old.expect,
-        invalid=old.error,
-    )
+def to_record(case: Case) -> dict[str, Any]:
+    """Return _case_ as a dictionary in the new test case format."""
+    record: dict[str, Any] = {
+        "name": case.description,
+        "template": case.template,
+        "data": case.globals,
+    }
 
+    if case.error:
+        record["invalid"] = True
+    else:
+        record["result"] = case.expect
 
-def migrate(cases: Sequence[Case]) -> str:
-    new_cases = [asdict(migrate_one(case)) for case in cases]
-    return json.dumps({"tests": new_cases}, indent=2)
+    if case.partials:
+        record["templates"] = case.partials
 
+    return record
 
-def asdict(case: NewCase) -> dict[str, Any]:
-    if case.invalid:
-        d = {
-            "name": case.name,
-            "template": case.template,
-            "data": case.data,
-            "invalid": case.invalid,
-        }
-    else:
-        d = {
-            "name": case.name,
-            "template": case.template,
-            "data": case.data,
-            "result": case.result,
-        }
 
-    if case.templates:
-        d["templates"] = case.templates
+def write_migrated(
+    cases: Sequence[Case], fd: BinaryIO, *, use_orjson: bool = False
+) -> None:
+    """Write _cases_, migrated to the new format, to _fd_ as indented JSON.
 
-    return d
+    By default JSON is written in chunks, as it is encoded by the standard
+    library, producing the same output as `json.dumps(obj, indent=2)`.
 
-
-RE_CASES = re.compile(r"cases = (\[.+\])\s+", re.DOTALL)
+    If _use_orjson_ is `True` and orjson is installed, orjson is used instead.
+    It is faster, but its output is not identical. Non-ASCII characters are
+    written as UTF-8 rather than escaped, so regenerated fixtures will differ
+    from those committed.
+    """
+    obj = {"tests": [to_record(case) for case in cases]}
+    if use_orjson and orjson is not None:
+        fd.write(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        for chunk in json.JSONEncoder(indent=2).iterencode(obj):
+            fd.write(chunk.encode())
+
+
+def migrate(cases: Sequence[Case], *, use_orjson: bool = False) -> str:
+    buf = BytesIO()
+    write_migrated(cases, buf, use_orjson=use_orjson)
+    return buf.getvalue().decode()
+
+
+CASES_START = "cases = ["
+
+
+def find_cases(source: str) -> str | None:
+    """Return the source of the list literal assigned to `cases`, or None.
+
+    This is a single, linear scan that balances brackets while skipping over
+    string literals and comments.
+    """
+    start = source.find(CASES_START)
+    if start == -1:
+        return None
+
+    start += len(CASES_START) - 1
+    depth = 0
+    quote = ""
+    i = start
+    length = len(source)
+
+    while i < length:
+        ch = source[i]
+        if quote:
+            if ch == "\\":
+                i += 1
+            elif source.startswith(quote, i):
+                i += len(quote) - 1
+                quote = ""
+        elif ch in "\"'":
+            quote = ch * 3 if source.startswith(ch * 3, i) else ch
+            i += len(quote) - 1
+        elif ch == "#":
+            i = source.find("\n", i)
+            if i == -1:
+                break
+        elif ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+            if depth == 0:
+                return source[start : i + 1]
+        i += 1
+
+    return None
 
 
 def extract_cases(source: str) -> list[Case]:
-    match = RE_CASES.search(source)
-    if not match:
-        raise Exception(f"failed: {source[:source.find("\n")]}")
-
-    namespace: dict[str, Any] = {"Case": Case}
-    return eval(match.group(1), namespace)  # type: ignore
+    cases = find_cases(source)
+    if cases is None:
+        first_line = source.split("\n", 1)[0]
+        raise Exception(f"failed: {first_line}")
+
+    tree = ast.parse(cases, mode="eval")
+    assert isinstance(tree.body, ast.List)
+    return [make_case(node) for node in tree.body.elts]
+
+
+def make_case(node: ast.expr) -> Case:
+    """Build a `Case` from a `Case(...)` call node containing only literals."""
+    if not (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "Case"
+    ):
+        raise Exception(f"expected a Case, found: {ast.unparse(node)}")
+
+    # Unlike the `eval` this replaces, `literal_eval` rejects names, calls and
+    # operators. Fail loudly with the offending case, rather than skipping it.
+    try:
+        args = [ast.literal_eval(arg) for arg in node.args]
+        kwargs: dict[str, Any] = {}
+
+        for keyword in node.keywords:
+            if keyword.arg is None:
+                raise Exception(f"unexpected unpacking: {ast.unparse(node)}")
+            kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+    except ValueError as err:
+        raise Exception(
+            f"case is not made of literals ({err}): {ast.unparse(node)}"
+        ) from err
+
+    return Case(*args, **kwargs)
 
 
 def files(path: Path) -> list[Path]:
@@ -102,21 +172,40 @@ PROJECT_ROOT = Path(__file__).parent
 OUT_PATH = PROJECT_ROOT / "python/tests/liquid2-compliance-test-suite/tests/filters"
 
 
-def extract(path: Path) -> None:
+def extract(path: Path, *, use_orjson: bool = False) -> None:
     with path.open() as fd:
-        cases = extract_cases(fd.read())
+        try:
+            cases = extract_cases(fd.read())
+        except Exception as err:
+            raise Exception(f"{path}: {err}") from err
 
-    filter_name = path.stem.rsplit("_", 1)[0]
-    out_path = OUT_PATH / (filter_name + ".json")
+    out_path = (OUT_PATH / path.stem.removesuffix("_filter")).with_suffix(".json")
 
     sys.stderr.write(f"Writing {len(cases)} to {out_path}..\n")
 
-    with out_path.open("w") as fd:
-        fd.write(migrate(cases))
-        fd.write("\n")
+    with out_path.open("wb") as fd:
+        write_migrated(cases, fd, use_orjson=use_orjson)
+        fd.write(b"\n")
 
 
 if __name__ == "__main__":
-    # print(migrate(cases))
-    for infile in files(Path(sys.argv[1])):
-        extract(infile)
+    parser = argparse.ArgumentParser(description="Migrate filter test cases.")
+    parser.add_argument("path", type=Path, help="directory of *_filter.py files")
+    parser.add_argument(
+        "--orjson",
+        action="store_true",
+        help=(
+            "encode JSON with orjson, if it is installed "
+            "(faster, but non-ASCII characters are not escaped)"
+        ),
+    )
+    args = parser.parse_args()
+
+    # Each file is independent and written to its own output path.
+    with ProcessPoolExecutor() as executor:
+        list(
+            executor.map(
+                partial(extract, use_orjson=args.orjson),
+                files(args.path),
+            )
+        )
@@ -1,18 +1,24 @@
 # noqa: D104
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 from _liquid2 import dummy_token
 from _liquid2 import Markup
 from _liquid2 import Token
 from _liquid2 import Whitespace
-from .ast import Node
-from .builtin import DictLoader
-from .context import RenderContext
-from .environment import Environment
-from .template import Template
-from .undefined import StrictDefaultUndefined
-from .undefined import StrictUndefined
-from .undefined import Undefined
+
+if TYPE_CHECKING:
+    from _liquid2 import TokenT  # noqa: F401
+
+    from .ast import Node
+    from .builtin import DictLoader
+    from .context import RenderContext
+    from .environment import Environment
+    from .tag import Tag
+    from .template import Template
+    from .undefined import StrictDefaultUndefined
+    from .undefined import StrictUndefined
+    from .undefined import Undefined
 
 __all__ = [
     "DictLoader",
@@ -30,8 +36,37 @@ __all__ = [
 ]
 
 if TYPE_CHECKING:
-    from _liquid2 import TokenT  # noqa: F401
-
     __all__.append("TokenT")
 
+# Names that are imported from their defining module on first access, so
+# importing `liquid2`, or one of its submodules, does not import the whole
+# package.
+_LAZY = {
+    "DictLoader": ".builtin",
+    "Environment": ".environment",
+    "Node": ".ast",
+    "RenderContext": ".context",
+    "StrictDefaultUndefined": ".undefined",
+    "StrictUndefined": ".undefined",
+    "Tag": ".tag",
+    "Template": ".template",
+    "Undefined": ".undefined",
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    obj = getattr(import_module(module, __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
+
 DUMMY_TOKEN = dummy_token()
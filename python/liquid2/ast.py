@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from abc import ABC
-from abc import abstractmethod
+import warnings
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
 from typing import Literal
 from typing import NamedTuple
 from typing import TextIO
@@ -22,11 +23,53 @@ if TYPE_CHECKING:
     from .expression import Expression
 
 
-class Node(ABC):
-    """Base class for all template nodes."""
+class Node:
+    """Base class for all template nodes.
+
+    Subclasses must implement `render_to_output` and `children`. This is checked
+    once, when the subclass is defined, rather than on every instantiation like
+    `abc.ABC` would. Pass `abstract=True` in the class definition to skip the
+    check for intermediate base classes.
+
+    Defining a subclass that is missing either method, without passing
+    `abstract=True`, issues a `DeprecationWarning`. It will become a `TypeError`
+    in a future release.
+    """
 
     __slots__ = ("token",)
 
+    # True if this node's async render path is just its sync render path, in which
+    # case async renderers call `render` directly, avoiding a coroutine per node.
+    # This is set automatically for subclasses that don't override `render_async`
+    # or `render_to_output_async`.
+    sync_only: ClassVar[bool] = True
+
+    def __init_subclass__(cls, *, abstract: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.sync_only = (
+            cls.render_async is Node.render_async
+            and cls.render_to_output_async is Node.render_to_output_async
+        )
+
+        if abstract:
+            return
+
+        missing = [
+            name
+            for name in ("render_to_output", "children")
+            if getattr(cls, name) is getattr(Node, name)
+        ]
+
+        if missing:
+            # While Node was an ABC, incomplete subclasses could be defined as
+            # long as they were not instantiated, so we warn rather than raise.
+            warnings.warn(
+                f"{cls.__name__} does not implement {' and '.join(missing)}, "
+                "pass abstract=True in its class definition if it is a base class",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
     def __init__(self, token: TokenT) -> None:
         super().__init__()
         self.token = token
@@ -43,13 +86,13 @@ class Node(ABC):
             self.raise_for_disabled(context.disabled_tags)
         return await self.render_to_output_async(context, buffer)
 
-    @abstractmethod
     def render_to_output(self, context: RenderContext, buffer: TextIO) -> int:
         """Render the node to the output buffer.
 
         Return:
             The number of "characters" written to the output buffer.
         """
+        raise NotImplementedError
 
     async def render_to_output_async(
         self, context: RenderContext, buffer: TextIO
@@ -66,10 +109,10 @@ class Node(ABC):
                 token=token,
             )
 
-    @abstractmethod
     def children(self) -> list[MetaNode]:
         """Return a list of child nodes and/or expressions associated with this node."""
         # TODO: cache children?
+        raise NotImplementedError
 
 
 class BlockNode(Node):
@@ -83,13 +126,22 @@ class BlockNode(Node):
 
     def render_to_output(self, context: RenderContext, buffer: TextIO) -> int:
         """Render the node to the output buffer."""
-        return sum(node.render(context, buffer) for node in self.nodes)
+        character_count = 0
+        for node in self.nodes:
+            character_count += node.render(context, buffer)
+        return character_count
 
     async def render_to_output_async(
         self, context: RenderContext, buffer: TextIO
     ) -> int:
         """Render the node to the output buffer."""
-        return sum([await node.render_async(context, buffer) for node in self.nodes])
+        character_count = 0
+        for node in self.nodes:
+            if node.sync_only:
+                character_count += node.render(context, buffer)
+            else:
+                character_count += await node.render_async(context, buffer)
+        return character_count
 
     def children(self) -> list[MetaNode]:
         """Return a list of child nodes and/or expressions associated with this node."""
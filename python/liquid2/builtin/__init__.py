@@ -147,7 +147,6 @@ __all__ = (
     "times",
     "Filter",
     "FilteredExpression",
-    "FilteredExpression",
     "FloatLiteral",
     "IfTag",
     "IncludeTag",
@@ -190,82 +189,87 @@ __all__ = (
 )
 
 
-def register_standard_tags_and_filters(env: Environment) -> None:  # noqa: PLR0915
+def register_standard_tags_and_filters(env: Environment) -> None:
     """Register standard tags and filters with an environment."""
-    env.filters["join"] = join
-    env.filters["first"] = first
-    env.filters["last"] = last
-    env.filters["concat"] = concat
-    env.filters["map"] = map_
-    env.filters["reverse"] = reverse
-    env.filters["sort"] = sort
-    env.filters["sort_natural"] = sort_natural
-    env.filters["sum"] = sum_
-    env.filters["where"] = where
-    env.filters["uniq"] = uniq
-    env.filters["compact"] = compact
-
-    env.filters["abs"] = abs_
-    env.filters["at_least"] = at_least
-    env.filters["at_most"] = at_most
-    env.filters["ceil"] = ceil
-    env.filters["divided_by"] = divided_by
-    env.filters["floor"] = floor
-    env.filters["minus"] = minus
-    env.filters["modulo"] = modulo
-    env.filters["plus"] = plus
-    env.filters["round"] = round_
-    env.filters["times"] = times
-
-    env.filters["date"] = date
-    env.filters["default"] = default
-    env.filters["size"] = size
-
-    env.filters["capitalize"] = capitalize
-    env.filters["append"] = append
-    env.filters["downcase"] = downcase
-    env.filters["escape"] = escape
-    env.filters["escape_once"] = escape_once
-    env.filters["lstrip"] = lstrip
-    env.filters["newline_to_br"] = newline_to_br
-    env.filters["prepend"] = prepend
-    env.filters["remove"] = remove
-    env.filters["remove_first"] = remove_first
-    env.filters["remove_last"] = remove_last
-    env.filters["replace"] = replace
-    env.filters["replace_first"] = replace_first
-    env.filters["replace_last"] = replace_last
-    env.filters["safe"] = safe
-    env.filters["slice"] = slice_
-    env.filters["split"] = split
-    env.filters["upcase"] = upcase
-    env.filters["strip"] = strip
-    env.filters["rstrip"] = rstrip
-    env.filters["strip_html"] = strip_html
-    env.filters["strip_newlines"] = strip_newlines
-    env.filters["truncate"] = truncate
-    env.filters["truncatewords"] = truncatewords
-    env.filters["url_encode"] = url_encode
-    env.filters["url_decode"] = url_decode
+    env.filters.update(
+        {
+            "join": join,
+            "first": first,
+            "last": last,
+            "concat": concat,
+            "map": map_,
+            "reverse": reverse,
+            "sort": sort,
+            "sort_natural": sort_natural,
+            "sum": sum_,
+            "where": where,
+            "uniq": uniq,
+            "compact": compact,
+            "abs": abs_,
+            "at_least": at_least,
+            "at_most": at_most,
+            "ceil": ceil,
+            "divided_by": divided_by,
+            "floor": floor,
+            "minus": minus,
+            "modulo": modulo,
+            "plus": plus,
+            "round": round_,
+            "times": times,
+            "date": date,
+            "default": default,
+            "size": size,
+            "capitalize": capitalize,
+            "append": append,
+            "downcase": downcase,
+            "escape": escape,
+            "escape_once": escape_once,
+            "lstrip": lstrip,
+            "newline_to_br": newline_to_br,
+            "prepend": prepend,
+            "remove": remove,
+            "remove_first": remove_first,
+            "remove_last": remove_last,
+            "replace": replace,
+            "replace_first": replace_first,
+            "replace_last": replace_last,
+            "safe": safe,
+            "slice": slice_,
+            "split": split,
+            "upcase": upcase,
+            "strip": strip,
+            "rstrip": rstrip,
+            "strip_html": strip_html,
+            "strip_newlines": strip_newlines,
+            "truncate": truncate,
+            "truncatewords": truncatewords,
+            "url_encode": url_encode,
+            "url_decode": url_decode,
+        }
+    )
 
-    env.tags["__COMMENT"] = Comment(env)
-    env.tags["__CONTENT"] = Content(env)
-    env.tags["__OUTPUT"] = Output(env)
-    env.tags["__RAW"] = RawTag(env)
-    env.tags["assign"] = AssignTag(env)
-    env.tags["if"] = IfTag(env)
-    env.tags["unless"] = UnlessTag(env)
-    env.tags["for"] = ForTag(env)
-    env.tags["break"] = BreakTag(env)
-    env.tags["continue"] = ContinueTag(env)
-    env.tags["capture"] = CaptureTag(env)
-    env.tags["case"] = CaseTag(env)
-    env.tags["cycle"] = CycleTag(env)
-    env.tags["decrement"] = DecrementTag(env)
-    env.tags["increment"] = IncrementTag(env)
-    env.tags["echo"] = EchoTag(env)
-    env.tags["include"] = IncludeTag(env)
-    env.tags["render"] = RenderTag(env)
-    env.tags["__LINES"] = LiquidTag(env)
-    env.tags["block"] = BlockTag(env)
-    env.tags["extends"] = ExtendsTag(env)
+    env.tags.update(
+        {
+            "__COMMENT": Comment(env),
+            "__CONTENT": Content(env),
+            "__OUTPUT": Output(env),
+            "__RAW": RawTag(env),
+            "assign": AssignTag(env),
+            "if": IfTag(env),
+            "unless": UnlessTag(env),
+            "for": ForTag(env),
+            "break": BreakTag(env),
+            "continue": ContinueTag(env),
+            "capture": CaptureTag(env),
+            "case": CaseTag(env),
+            "cycle": CycleTag(env),
+            "decrement": DecrementTag(env),
+            "increment": IncrementTag(env),
+            "echo": EchoTag(env),
+            "include": IncludeTag(env),
+            "render": RenderTag(env),
+            "__LINES": LiquidTag(env),
+            "block": BlockTag(env),
+            "extends": ExtendsTag(env),
+        }
+    )
@@ -64,30 +64,23 @@ class Content(Tag):
 
         return self.node_class(token, self.trim(token.text, left_trim, right_trim))
 
-    def trim(self, text: str, left_trim: Whitespace, right_trim: Whitespace) -> str:  # noqa: PLR0911
+    def trim(self, text: str, left_trim: Whitespace, right_trim: Whitespace) -> str:
         """Return text after applying whitespace control."""
-        match (left_trim, right_trim):
-            case (Whitespace.Default, Whitespace.Default):
-                return self.trim(text, self.env.trim, self.env.trim)
-            case (Whitespace.Default, _):
-                return self.trim(text, self.env.trim, right_trim)
-            case (_, Whitespace.Default):
-                return self.trim(text, left_trim, self.env.trim)
-
-            case (Whitespace.Minus, Whitespace.Minus):
-                return text.strip()
-            case (Whitespace.Minus, Whitespace.Plus):
-                return text.lstrip()
-            case (Whitespace.Plus, Whitespace.Minus):
-                return text.rstrip()
-            case (Whitespace.Plus, Whitespace.Plus):
-                return text
-
-            case (Whitespace.Smart, Whitespace.Smart):
-                return text.strip("\r\n")
-            case (Whitespace.Smart, right):
-                return self.trim(text.lstrip("\r\n"), Whitespace.Plus, right)
-            case (left, Whitespace.Smart):
-                return self.trim(text.rstrip("\r\n"), left, Whitespace.Plus)
-            case _:
-                return text
+        # Each side is trimmed independently of the other, so we resolve the
+        # default for each side and apply at most one strip method per side.
+        if left_trim == Whitespace.Default:
+            left_trim = self.env.trim
+
+        if right_trim == Whitespace.Default:
+            right_trim = self.env.trim
+
+        if left_trim == Whitespace.Minus:
+            text = text.lstrip()
+        elif left_trim == Whitespace.Smart:
+            text = text.lstrip("\r\n")
+
+        if right_trim == Whitespace.Minus:
+            return text.rstrip()
+        if right_trim == Whitespace.Smart:
+            return text.rstrip("\r\n")
+        return text
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import sys
+from contextlib import suppress
 from decimal import Decimal
 from itertools import islice
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Collection
 from typing import Generic
 from typing import Iterator
@@ -22,6 +25,7 @@ from _liquid2 import parse_query
 from markupsafe import Markup
 
 from liquid2.context import RenderContext
+from liquid2.exceptions import LiquidError
 from liquid2.exceptions import LiquidSyntaxError
 from liquid2.exceptions import LiquidTypeError
 from liquid2.expression import Expression
@@ -55,10 +59,18 @@ class Null(Expression):
         return []
 
 
+# Exact types that can be empty or blank. Testing membership of an object's exact
+# type is cheaper than `isinstance` with a tuple. Subclasses, like `Markup`, fall
+# through to the `isinstance` checks.
+_SEQUENCE_TYPES: frozenset[type] = frozenset([list, dict, str])
+
+
 class Empty(Expression):
     __slots__ = ()
 
     def __eq__(self, other: object) -> bool:
+        if other.__class__ in _SEQUENCE_TYPES:
+            return not other
         if isinstance(other, Empty):
             return True
         return isinstance(other, (list, dict, str)) and not other
@@ -78,6 +90,8 @@ class Empty(Expression):
 
 def is_empty(obj: object) -> bool:
     """Return True if _obj_ is considered empty."""
+    if obj.__class__ in _SEQUENCE_TYPES:
+        return not obj
     return isinstance(obj, (list, dict, str)) and not obj
 
 
@@ -85,6 +99,8 @@ class Blank(Expression):
     __slots__ = ()
 
     def __eq__(self, other: object) -> bool:
+        if other.__class__ in _SEQUENCE_TYPES:
+            return not other or (isinstance(other, str) and other.isspace())
         if isinstance(other, str) and (not other or other.isspace()):
             return True
         if isinstance(other, (list, dict)) and not other:
@@ -106,6 +122,8 @@ class Blank(Expression):
 
 def is_blank(obj: object) -> bool:
     """Return True if _obj_ is considered blank."""
+    if obj.__class__ in _SEQUENCE_TYPES:
+        return not obj or (isinstance(obj, str) and obj.isspace())
     if isinstance(obj, str) and (not obj or obj.isspace()):
         return True
     return isinstance(obj, (list, dict)) and not obj
@@ -144,7 +162,9 @@ class Literal(Expression, Generic[T]):
         return repr(self.value)
 
     def __eq__(self, other: object) -> bool:
-        return self.value == other
+        # Literals of different types are never equal, even when their values
+        # are, like `1` and `1.0`. Comparing exact types keeps `==` symmetric.
+        return type(other) is type(self) and self.value == other.value  # type: ignore
 
     def __hash__(self) -> int:
         return hash(self.value)
@@ -165,12 +185,6 @@ class TrueLiteral(Literal[bool]):
     def __init__(self, token: TokenT) -> None:
         super().__init__(token, True)  # noqa: FBT003
 
-    def __eq__(self, other: object) -> bool:
-        return isinstance(other, TrueLiteral) and self.value == other.value
-
-    def __hash__(self) -> int:
-        return hash(self.value)
-
 
 class FalseLiteral(Literal[bool]):
     __slots__ = ()
@@ -178,31 +192,23 @@ class FalseLiteral(Literal[bool]):
     def __init__(self, token: TokenT) -> None:
         super().__init__(token, False)  # noqa: FBT003
 
-    def __eq__(self, other: object) -> bool:
-        return isinstance(other, TrueLiteral) and self.value == other.value
-
-    def __hash__(self) -> int:
-        return hash(self.value)
-
 
 class StringLiteral(Literal[str]):
-    __slots__ = ()
+    __slots__ = ("_markup",)
 
     def __init__(self, token: TokenT, value: str):
         super().__init__(token, value)
-
-    def __eq__(self, other: object) -> bool:
-        return isinstance(other, StringLiteral) and self.value == other.value
-
-    def __hash__(self) -> int:
-        return hash(self.value)
+        self._markup: Markup | None = None
 
     def __sizeof__(self) -> int:
         return sys.getsizeof(self.value)
 
     def evaluate(self, context: RenderContext) -> str | Markup:
         if context.auto_escape:
-            return Markup(self.value)
+            # Markup is immutable, so we build it once, the first time it's needed.
+            if self._markup is None:
+                self._markup = Markup(self.value)
+            return self._markup
         return self.value
 
 
@@ -212,12 +218,6 @@ class IntegerLiteral(Literal[int]):
     def __init__(self, token: TokenT, value: int):
         super().__init__(token, value)
 
-    def __eq__(self, other: object) -> bool:
-        return isinstance(other, IntegerLiteral) and self.value == other.value
-
-    def __hash__(self) -> int:
-        return hash(self.value)
-
 
 class FloatLiteral(Literal[float]):
     __slots__ = ()
@@ -225,21 +225,23 @@ class FloatLiteral(Literal[float]):
     def __init__(self, token: TokenT, value: float):
         super().__init__(token, value)
 
-    def __eq__(self, other: object) -> bool:
-        return isinstance(other, FloatLiteral) and self.value == other.value
-
-    def __hash__(self) -> int:
-        return hash(self.value)
-
 
 class RangeLiteral(Expression):
-    __slots__ = ("start", "stop")
+    __slots__ = ("start", "stop", "_range")
 
     def __init__(self, token: TokenT, start: Expression, stop: Expression):
         super().__init__(token=token)
         self.start = start
         self.stop = stop
 
+        # A range with literal start and stop values is the same on every
+        # render, and `range` objects are immutable, so build it once now.
+        # Errors are left for render time.
+        self._range: range | None = None
+        if isinstance(start, Literal) and isinstance(stop, Literal):
+            with suppress(LiquidError):
+                self._range = self._make_range(start.value, stop.value)
+
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, RangeLiteral)
@@ -259,6 +261,10 @@ class RangeLiteral(Expression):
         )
 
     def _make_range(self, start: Any, stop: Any) -> range:
+        # Range bounds are usually integers already.
+        if start.__class__ is int and stop.__class__ is int:
+            return range(start, stop + 1) if start <= stop else range(0)
+
         try:
             start = to_int(start)
         except ValueError:
@@ -276,11 +282,15 @@ class RangeLiteral(Expression):
         return range(start, stop + 1)
 
     def evaluate(self, context: RenderContext) -> range:
+        if self._range is not None:
+            return self._range
         return self._make_range(
             self.start.evaluate(context), self.stop.evaluate(context)
         )
 
     async def evaluate_async(self, context: RenderContext) -> range:
+        if self._range is not None:
+            return self._range
         return self._make_range(
             await self.start.evaluate_async(context),
             await self.stop.evaluate_async(context),
@@ -340,7 +350,11 @@ class FilteredExpression(Expression):
         return rv
 
     async def evaluate_async(self, context: RenderContext) -> object:
-        rv = await self.left.evaluate_async(context)
+        if self.left.sync_only:
+            rv = self.left.evaluate(context)
+        else:
+            rv = await self.left.evaluate_async(context)
+
         if self.filters:
             for f in self.filters:
                 rv = await f.evaluate_async(rv, context)
@@ -353,6 +367,15 @@ class FilteredExpression(Expression):
                 children.extend(filter_.children())
         return children
 
+    def unwrap(self) -> Expression:
+        """Return the left hand expression if there are no filters, or self.
+
+        `{{ x }}` is by far the most common output statement, and
+        `{% assign x = y %}` is common too. Without any filters there's no
+        need for the FilteredExpression wrapper and its extra call per render.
+        """
+        return self.left if not self.filters else self
+
     @staticmethod
     def parse(stream: TokenStream) -> FilteredExpression | TernaryFilteredExpression:
         """Return a new FilteredExpression parsed from _tokens_."""
@@ -366,36 +389,60 @@ class FilteredExpression(Expression):
         return FilteredExpression(left.token, left, filters)
 
 
-def parse_primitive(token: TokenT | None) -> Expression:  # noqa: PLR0911
+def parse_primitive(token: TokenT | None) -> Expression:
     """Parse _token_ as a primitive expression."""
-    match token:
-        case Token.True_():
-            return TrueLiteral(token=token)
-        case Token.False_():
-            return FalseLiteral(token=token)
-        case Token.Null():
-            return Null(token=token)
-        case Token.Word(value):
-            if value == "empty":
-                return Empty(token=token)
-            if value == "blank":
-                return Blank(token=token)
-            return Query(token, compile(parse_query(value)))
-        case Token.RangeLiteral(start, stop):
-            return RangeLiteral(token, parse_primitive(start), parse_primitive(stop))
-        case Token.StringLiteral(value) | RangeArgument.StringLiteral(value):
-            return StringLiteral(token, value)
-        case Token.IntegerLiteral(value) | RangeArgument.IntegerLiteral(value):
-            return IntegerLiteral(token, value)
-        case Token.FloatLiteral(value) | RangeArgument.FloatLiteral(value):
-            return FloatLiteral(token, value)
-        case Token.Query(path) | RangeArgument.Query(path):
-            return Query(token, compile(path))
-        case _:
-            raise LiquidSyntaxError(
-                f"expected a primitive expression, found {token.__class__.__name__}",
-                token=token,
-            )
+    parse = PRIMITIVES.get(token.__class__)
+    if parse is None:
+        raise LiquidSyntaxError(
+            f"expected a primitive expression, found {token.__class__.__name__}",
+            token=token,
+        )
+    return parse(token)
+
+
+def _parse_word(token: Token.Word) -> Expression:
+    value = token.value
+    if value == "empty":
+        return Empty(token=token)
+    if value == "blank":
+        return Blank(token=token)
+    return Query(token, compile(parse_query(value)))
+
+
+# Map token types to functions that parse them into a primitive expression.
+# Lookup by exact type is cheaper than testing a sequence of class patterns.
+PRIMITIVES: dict[type, Callable[[Any], Expression]] = {
+    Token.True_: TrueLiteral,
+    Token.False_: FalseLiteral,
+    Token.Null: Null,
+    Token.Word: _parse_word,
+    Token.RangeLiteral: lambda token: RangeLiteral(
+        token, parse_primitive(token.start), parse_primitive(token.stop)
+    ),
+    Token.StringLiteral: lambda token: StringLiteral(token, token.value),
+    RangeArgument.StringLiteral: lambda token: StringLiteral(token, token.value),
+    Token.IntegerLiteral: lambda token: IntegerLiteral(token, token.value),
+    RangeArgument.IntegerLiteral: lambda token: IntegerLiteral(token, token.value),
+    Token.FloatLiteral: lambda token: FloatLiteral(token, token.value),
+    RangeArgument.FloatLiteral: lambda token: FloatLiteral(token, token.value),
+    Token.Query: lambda token: Query(token, compile(token.path)),
+    RangeArgument.Query: lambda token: Query(token, compile(token.path)),
+}
+
+
+# Token types that are parsed as a positional filter argument with PRIMITIVES.
+# Words are handled separately, as they might be the name of a keyword argument.
+POSITIONAL_ARGUMENT_TOKENS = frozenset(
+    [
+        Token.Query,
+        Token.IntegerLiteral,
+        Token.FloatLiteral,
+        Token.StringLiteral,
+        Token.False_,
+        Token.True_,
+        Token.Null,
+    ]
+)
 
 
 class TernaryFilteredExpression(Expression):
@@ -468,11 +515,21 @@ class TernaryFilteredExpression(Expression):
 
         return children
 
+    def unwrap(self) -> Expression:
+        """Return self. Ternary expressions are never unwrapped."""
+        return self
+
     @staticmethod
     def parse(
         expr: FilteredExpression, stream: TokenStream
-    ) -> TernaryFilteredExpression:
-        """Return a new TernaryFilteredExpression parsed from tokens in _stream_."""
+    ) -> FilteredExpression | TernaryFilteredExpression:
+        """Return a new TernaryFilteredExpression parsed from tokens in _stream_.
+
+        A FilteredExpression is returned instead if the condition is constant.
+        It holds the selected branch and its filters, followed by any tail
+        filters. The condition and the branch that can never be selected are
+        dropped, so static analysis does not report their variables or filters.
+        """
         stream.expect(Token.If)
         next(stream)
         condition = BooleanExpression.parse(stream)
@@ -490,13 +547,34 @@ class TernaryFilteredExpression(Expression):
         if isinstance(stream.current(), Token.DoublePipe):
             tail_filters = Filter.parse(stream, delim=(Token.Pipe, Token.DoublePipe))
 
+        # A constant condition always selects the same branch, so we can drop
+        # the other one and the condition itself.
+        if isinstance(condition.expression, _CONSTANT_EXPRESSIONS):
+            if condition.evaluate(_CONSTANT_CONTEXT):
+                return FilteredExpression(
+                    expr.token,
+                    expr.left,
+                    [*(expr.filters or []), *(tail_filters or [])] or None,
+                )
+
+            return FilteredExpression(
+                expr.token,
+                alternative or Null(expr.token),
+                [*(filters or []), *(tail_filters or [])] or None,
+            )
+
         return TernaryFilteredExpression(
             expr.token, expr, condition, alternative, filters, tail_filters
         )
 
 
+# Keyword arguments for filters that don't have any. This is shared, so it must
+# never be mutated.
+_NO_KEYWORD_ARGS: Mapping[str, object] = MappingProxyType({})
+
+
 class Filter:
-    __slots__ = ("name", "args", "token")
+    __slots__ = ("name", "args", "token", "_arguments", "_positional", "_sync_only")
 
     def __init__(
         self,
@@ -505,19 +583,47 @@ class Filter:
         arguments: list[KeywordArgument | PositionalArgument],
     ) -> None:
         self.token = token
-        self.name = name
+        # Filter names come from the lexer as new strings. Interning them lets
+        # `env.filters` lookups match registered names by identity.
+        self.name = sys.intern(name)
         self.args = arguments
 
+        # Whether an argument is positional or keyword is fixed at parse time, so
+        # we sort that out once. This is a `(name, value)` pair for each argument,
+        # in source order, with a name of None for positional arguments.
+        self._arguments: tuple[tuple[str | None, Expression], ...] = tuple(
+            (arg.name if isinstance(arg, KeywordArgument) else None, arg.value)
+            for arg in arguments
+        )
+
+        # Most filters have positional arguments only. For those we keep a tuple
+        # of argument values, so we don't have to test the kind of each argument
+        # on every render, and return a shared empty mapping in place of a new
+        # keyword dict. This is None if there are keyword arguments, which are
+        # evaluated in source order along with positional arguments.
+        self._positional: tuple[Expression, ...] | None = (
+            None
+            if any(name is not None for name, _ in self._arguments)
+            else tuple(value for _, value in self._arguments)
+        )
+
+        # Arguments are usually literals and queries, which can be evaluated
+        # synchronously on async render paths too.
+        self._sync_only = all(arg.value.sync_only for arg in arguments)
+
     def __str__(self) -> str:
         if self.args:
-            return f"{self.name}: {''.join(str(arg for arg in self.args))}"
+            return f"{self.name}: {', '.join(str(arg) for arg in self.args)}"
         return self.name
 
     def evaluate(self, left: object, context: RenderContext) -> object:
         func = context.filter(self.name, token=self.token)
         positional_args, keyword_args = self.evaluate_args(context)
+
         try:
-            return func(left, *positional_args, **keyword_args)
+            if keyword_args:
+                return func(left, *positional_args, **keyword_args)
+            return func(left, *positional_args)
         except TypeError as err:
             raise LiquidTypeError(f"{self.name}: {err}", token=self.token) from err
         except LiquidTypeError as err:
@@ -533,7 +639,9 @@ class Filter:
             raise NotImplementedError(":(")
 
         try:
-            return func(left, *positional_args, **keyword_args)
+            if keyword_args:
+                return func(left, *positional_args, **keyword_args)
+            return func(left, *positional_args)
         except TypeError as err:
             raise LiquidTypeError(f"{self.name}: {err}", token=self.token) from err
         except LiquidTypeError as err:
@@ -542,29 +650,38 @@ class Filter:
 
     def evaluate_args(
         self, context: RenderContext
-    ) -> tuple[list[object], dict[str, object]]:
+    ) -> tuple[list[object], Mapping[str, object]]:
+        if self._positional is not None:
+            return [arg.evaluate(context) for arg in self._positional], _NO_KEYWORD_ARGS
+
         positional_args: list[object] = []
         keyword_args: dict[str, object] = {}
-        for arg in self.args:
-            name, value = arg.evaluate(context)
-            if name:
-                keyword_args[name] = value
+        for name, value in self._arguments:
+            if name is None:
+                positional_args.append(value.evaluate(context))
             else:
-                positional_args.append(value)
+                keyword_args[name] = value.evaluate(context)
 
         return positional_args, keyword_args
 
     async def evaluate_args_async(
         self, context: RenderContext
-    ) -> tuple[list[object], dict[str, object]]:
+    ) -> tuple[list[object], Mapping[str, object]]:
+        if self._sync_only:
+            return self.evaluate_args(context)
+
+        if self._positional is not None:
+            return [
+                await arg.evaluate_async(context) for arg in self._positional
+            ], _NO_KEYWORD_ARGS
+
         positional_args: list[object] = []
         keyword_args: dict[str, object] = {}
-        for arg in self.args:
-            name, value = await arg.evaluate_async(context)
-            if name:
-                keyword_args[name] = value
+        for name, value in self._arguments:
+            if name is None:
+                positional_args.append(await value.evaluate_async(context))
             else:
-                positional_args.append(value)
+                keyword_args[name] = await value.evaluate_async(context)
 
         return positional_args, keyword_args
 
@@ -572,7 +689,7 @@ class Filter:
         return [arg.value for arg in self.args]
 
     @staticmethod
-    def parse(  # noqa: PLR0912
+    def parse(
         stream: TokenStream,
         *,
         delim: tuple[Type[Token.Pipe] | Type[Token.DoublePipe], ...],
@@ -591,54 +708,35 @@ class Filter:
                 next(stream)  # Move past ':'
                 while True:
                     token = stream.current()
-                    match token:
-                        case Token.Word(value):
-                            if isinstance(stream.peek(), (Token.Assign, Token.Colon)):
-                                # A named or keyword argument
-                                stream.next()  # skip = or :
-                                stream.next()
-                                filter_arguments.append(
-                                    KeywordArgument(
-                                        value, parse_primitive(stream.current())
-                                    )
-                                )
-                            else:
-                                # A positional query that is a single word
-                                filter_arguments.append(
-                                    PositionalArgument(
-                                        Query(
-                                            token,
-                                            compile(parse_query(value)),
-                                        )
-                                    )
-                                )
-                        case Token.Query(path):
-                            filter_arguments.append(
-                                PositionalArgument(Query(token, compile(path)))
-                            )
-                        case (
-                            Token.IntegerLiteral()
-                            | Token.FloatLiteral()
-                            | Token.StringLiteral()
-                        ):
-                            filter_arguments.append(
-                                PositionalArgument(parse_primitive(stream.current()))
-                            )
-                        case Token.False_():
+                    kind = token.__class__
+
+                    if isinstance(token, Token.Word):
+                        value = token.value
+                        if isinstance(stream.peek(), (Token.Assign, Token.Colon)):
+                            # A named or keyword argument
+                            stream.next()  # skip = or :
+                            stream.next()
                             filter_arguments.append(
-                                PositionalArgument(FalseLiteral(token))
+                                KeywordArgument(
+                                    value, parse_primitive(stream.current())
+                                )
                             )
-                        case Token.True_():
+                        else:
+                            # A positional query that is a single word
                             filter_arguments.append(
-                                PositionalArgument(TrueLiteral(token))
+                                PositionalArgument(
+                                    Query(token, compile(parse_query(value)))
+                                )
                             )
-                        case Token.Null():
-                            filter_arguments.append(PositionalArgument(Null(token)))
-                        case Token.Comma():
-                            # XXX: leading, trailing and duplicate commas are OK
-                            pass
-                        case _:
-                            break
+                    elif kind in POSITIONAL_ARGUMENT_TOKENS:
+                        filter_arguments.append(
+                            PositionalArgument(PRIMITIVES[kind](token))
+                        )
+                    elif kind is Token.Comma:
+                        # XXX: leading, trailing and duplicate commas are OK
+                        pass
+                    else:
+                        break
 
                     stream.next()
 
@@ -655,6 +753,9 @@ class KeywordArgument:
         self.name = name
         self.value = value
 
+    def __str__(self) -> str:
+        return f"{self.name}: {self.value}"
+
     def evaluate(self, context: RenderContext) -> tuple[str, object]:
         return (self.name, self.value.evaluate(context))
 
@@ -672,6 +773,9 @@ class PositionalArgument:
         self.token = value.token
         self.value = value
 
+    def __str__(self) -> str:
+        return str(self.value)
+
     def evaluate(self, context: RenderContext) -> tuple[None, object]:
         return (None, self.value.evaluate(context))
 
@@ -698,7 +802,10 @@ class BooleanExpression(Expression):
         self.expression = expression
 
     def evaluate(self, context: RenderContext) -> object:
-        return is_truthy(self.expression.evaluate(context))
+        # Conditions are usually comparisons or logical expressions, so we test
+        # for bools before falling back to a call to `is_truthy`.
+        value = self.expression.evaluate(context)
+        return value is True or (value is not False and is_truthy(value))
 
     async def evaluate_async(self, context: RenderContext) -> object:
         return is_truthy(await self.expression.evaluate_async(context))
@@ -752,47 +859,27 @@ BINARY_OPERATORS = frozenset(
 )
 
 
-def parse_boolean_primitive(  # noqa: PLR0912
+def parse_boolean_primitive(
     stream: TokenStream, precedence: int = PRECEDENCE_LOWEST
 ) -> Expression:
     """Parse a Boolean expression from tokens in _stream_."""
     left: Expression
     token = next(stream, None)
-
-    match token:
-        case Token.True_():
-            left = TrueLiteral(token=token)
-        case Token.False_():
-            left = FalseLiteral(token=token)
-        case Token.Null():
-            left = Null(token=token)
-        case Token.Word(value):
-            if value == "empty":
-                left = Empty(token=token)
-            elif value == "blank":
-                left = Blank(token=token)
-            else:
-                left = Query(token, compile(parse_query(value)))
-        case Token.RangeLiteral(start, stop):
-            left = RangeLiteral(token, parse_primitive(start), parse_primitive(stop))
-        case Token.StringLiteral(value):
-            left = StringLiteral(token, value)
-        case Token.IntegerLiteral(value):
-            left = IntegerLiteral(token, value)
-        case Token.FloatLiteral(value):
-            left = FloatLiteral(token, value)
-        case Token.Query(path):
-            left = Query(token, compile(path))
-        case Token.Not():
-            left = LogicalNotExpression.parse(stream)
-        case Token.LeftParen():
-            left = parse_grouped_expression(stream)
-        case _:
+    kind = token.__class__
+
+    if kind is Token.Not:
+        left = LogicalNotExpression.parse(stream)
+    elif kind is Token.LeftParen:
+        left = parse_grouped_expression(stream)
+    else:
+        parse = PRIMITIVES.get(kind)
+        if parse is None:
             raise LiquidSyntaxError(
                 "expected a primitive expression, "
                 f"found {stream.current().__class__.__name__}",
                 token=stream.current(),
             )
+        left = parse(token)
 
     while True:
         token = stream.current()
@@ -810,58 +897,26 @@ def parse_boolean_primitive(  # noqa: PLR0912
     return left
 
 
-def parse_infix_expression(stream: TokenStream, left: Expression) -> Expression:  # noqa: PLR0911
+def parse_infix_expression(stream: TokenStream, left: Expression) -> Expression:
     """Return a logical, comparison, or membership expression parsed from _stream_."""
     token = next(stream, None)
     assert token is not None
-    precedence = PRECEDENCES.get(token.__class__, PRECEDENCE_LOWEST)
+    kind = token.__class__
+    expression_class = INFIX_EXPRESSIONS.get(kind)
 
-    match token:
-        case Token.Eq():
-            return EqExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.Lt():
-            return LtExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.Gt():
-            return GtExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.Ne():
-            return NeExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.Le():
-            return LeExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.Ge():
-            return GeExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.Contains():
-            return ContainsExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.In():
-            return InExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.And():
-            return LogicalAndExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case Token.Or():
-            return LogicalOrExpression(
-                token, left, parse_boolean_primitive(stream, precedence)
-            )
-        case _:
-            raise LiquidSyntaxError(
-                f"expected an infix expression, found {token.__class__.__name__}",
-                token=token,
-            )
+    if expression_class is None:
+        raise LiquidSyntaxError(
+            f"expected an infix expression, found {kind.__name__}",
+            token=token,
+        )
+
+    return fold_constant(
+        expression_class(
+            token,
+            left,
+            parse_boolean_primitive(stream, PRECEDENCES.get(kind, PRECEDENCE_LOWEST)),
+        )
+    )
 
 
 def parse_grouped_expression(stream: TokenStream) -> Expression:
@@ -896,7 +951,8 @@ class LogicalNotExpression(Expression):
         self.expression = expression
 
     def evaluate(self, context: RenderContext) -> object:
-        return not is_truthy(self.expression.evaluate(context))
+        value = self.expression.evaluate(context)
+        return value is False or (value is not True and not is_truthy(value))
 
     async def evaluate_async(self, context: RenderContext) -> object:
         return not is_truthy(await self.expression.evaluate_async(context))
@@ -904,7 +960,7 @@ class LogicalNotExpression(Expression):
     @staticmethod
     def parse(stream: TokenStream) -> Expression:
         expr = parse_boolean_primitive(stream)
-        return LogicalNotExpression(expr.token, expr)
+        return fold_constant(LogicalNotExpression(expr.token, expr))
 
     def children(self) -> list[Expression]:
         return [self.expression]
@@ -919,14 +975,26 @@ class LogicalAndExpression(Expression):
         self.right = right
 
     def evaluate(self, context: RenderContext) -> object:
-        return is_truthy(self.left.evaluate(context)) and is_truthy(
-            self.right.evaluate(context)
-        )
+        # `a and b and c` is parsed as `a and (b and c)`. We walk down the right
+        # hand side of a chain in one loop, instead of one call per operator.
+        expr: Expression = self
+        while type(expr) is LogicalAndExpression:
+            value = expr.left.evaluate(context)
+            if value is False or (value is not True and not is_truthy(value)):
+                return False
+            expr = expr.right
+
+        value = expr.evaluate(context)
+        return value is True or (value is not False and is_truthy(value))
 
     async def evaluate_async(self, context: RenderContext) -> object:
-        return is_truthy(await self.left.evaluate_async(context)) and is_truthy(
-            await self.right.evaluate_async(context)
-        )
+        expr: Expression = self
+        while type(expr) is LogicalAndExpression:
+            if not is_truthy(await expr.left.evaluate_async(context)):
+                return False
+            expr = expr.right
+
+        return is_truthy(await expr.evaluate_async(context))
 
     def children(self) -> list[Expression]:
         return [self.left, self.right]
@@ -941,14 +1009,25 @@ class LogicalOrExpression(Expression):
         self.right = right
 
     def evaluate(self, context: RenderContext) -> object:
-        return is_truthy(self.left.evaluate(context)) or is_truthy(
-            self.right.evaluate(context)
-        )
+        # See LogicalAndExpression.evaluate.
+        expr: Expression = self
+        while type(expr) is LogicalOrExpression:
+            value = expr.left.evaluate(context)
+            if value is True or (value is not False and is_truthy(value)):
+                return True
+            expr = expr.right
+
+        value = expr.evaluate(context)
+        return value is True or (value is not False and is_truthy(value))
 
     async def evaluate_async(self, context: RenderContext) -> object:
-        return is_truthy(await self.left.evaluate_async(context)) or is_truthy(
-            await self.right.evaluate_async(context)
-        )
+        expr: Expression = self
+        while type(expr) is LogicalOrExpression:
+            if is_truthy(await expr.left.evaluate_async(context)):
+                return True
+            expr = expr.right
+
+        return is_truthy(await expr.evaluate_async(context))
 
     def children(self) -> list[Expression]:
         return [self.left, self.right]
@@ -1135,6 +1214,86 @@ class InExpression(Expression):
         return [self.left, self.right]
 
 
+# Map infix operator token types to the expression they build.
+INFIX_EXPRESSIONS: dict[
+    type, Callable[[TokenT, Expression, Expression], Expression]
+] = {
+    Token.Eq: EqExpression,
+    Token.Lt: LtExpression,
+    Token.Gt: GtExpression,
+    Token.Ne: NeExpression,
+    Token.Le: LeExpression,
+    Token.Ge: GeExpression,
+    Token.Contains: ContainsExpression,
+    Token.In: InExpression,
+    Token.And: LogicalAndExpression,
+    Token.Or: LogicalOrExpression,
+}
+
+
+class _ConstantContext:
+    """A stand-in render context for evaluating expressions with constant operands.
+
+    Constant operands never look at render context data. The only attribute
+    they read is `auto_escape`, and comparing a `Markup` string gives the same
+    result as comparing a plain `str`.
+    """
+
+    __slots__ = ()
+
+    auto_escape = False
+
+
+_CONSTANT_CONTEXT = cast("RenderContext", _ConstantContext())
+
+# Expressions that evaluate to the same value on every render.
+_CONSTANT_EXPRESSIONS = (Literal, Null, Empty, Blank)
+
+
+def fold_constant(expression: Expression) -> Expression:
+    """Return _expression_ as a Boolean literal if all of its operands are constant.
+
+    _expression_ is returned unchanged if any of its operands depend on render
+    context data, or if evaluating it fails, so errors are still raised at
+    render time.
+
+    A logical `and` or `or` with a constant left operand is short-circuited, even
+    if its right operand is not constant.
+    """
+    if not all(
+        isinstance(child, _CONSTANT_EXPRESSIONS) for child in expression.children()
+    ):
+        if isinstance(
+            expression, (LogicalAndExpression, LogicalOrExpression)
+        ) and isinstance(expression.left, _CONSTANT_EXPRESSIONS):
+            return _short_circuit(expression)
+        return expression
+
+    try:
+        result = expression.evaluate(_CONSTANT_CONTEXT)
+    except LiquidError:
+        return expression
+
+    if is_truthy(result):
+        return TrueLiteral(token=expression.token)
+    return FalseLiteral(token=expression.token)
+
+
+def _short_circuit(
+    expression: LogicalAndExpression | LogicalOrExpression,
+) -> Expression:
+    left = is_truthy(expression.left.evaluate(_CONSTANT_CONTEXT))
+
+    if isinstance(expression, LogicalAndExpression):
+        if not left:
+            return FalseLiteral(token=expression.token)
+    elif left:
+        return TrueLiteral(token=expression.token)
+
+    # The result depends on the right operand alone.
+    return BooleanExpression(expression.right.token, expression.right)
+
+
 class LoopExpression(Expression):
     __slots__ = ("identifier", "iterable", "limit", "offset", "reversed", "cols")
 
@@ -1486,14 +1645,31 @@ def parse_keyword_arguments(tokens: TokenStream) -> list[KeywordArgument]:
     return args
 
 
+# Built-in types that never define `__liquid__`. Testing exact type membership
+# is cheaper than probing for the attribute with `hasattr`.
+_PLAIN_TYPES = frozenset(
+    [str, int, float, bool, list, dict, tuple, range, type(None), Decimal, Markup]
+)
+
+
 def is_truthy(obj: object) -> bool:
     """Return _True_ if _obj_ is considered Liquid truthy."""
+    if obj.__class__ in _PLAIN_TYPES:
+        return not (obj is False or obj is None)
     if hasattr(obj, "__liquid__"):
         obj = obj.__liquid__()
     return not (obj is False or obj is None)
 
 
+# Types that compare with `<` when both operands are of the same exact type.
+_ORDERED_TYPES = frozenset([str, int, float, Decimal, Markup])
+
+
 def _eq(left: object, right: object) -> bool:
+    # Operands of the same plain type need none of the special cases below.
+    if left.__class__ is right.__class__ and left.__class__ in _PLAIN_TYPES:
+        return left == right
+
     if isinstance(right, (Empty, Blank)):
         left, right = right, left
 
@@ -1508,6 +1684,9 @@ def _eq(left: object, right: object) -> bool:
 
 
 def _lt(token: TokenT, left: object, right: object) -> bool:
+    if left.__class__ is right.__class__ and left.__class__ in _ORDERED_TYPES:
+        return left < right  # type: ignore
+
     if isinstance(left, str) and isinstance(right, str):
         return left < right
 
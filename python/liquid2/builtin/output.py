@@ -4,11 +4,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import TextIO
+from typing import cast
 
 from liquid2 import Markup
 from liquid2 import Node
 from liquid2.ast import MetaNode
 from liquid2.builtin import FilteredExpression
+from liquid2.builtin import Literal
+from liquid2.builtin import Null
 from liquid2.context import RenderContext
 from liquid2.stringify import to_liquid_string
 from liquid2.tag import Tag
@@ -16,6 +19,7 @@ from liquid2.tokens import TokenStream
 
 if TYPE_CHECKING:
     from liquid2 import TokenT
+    from liquid2.builtin import Content
     from liquid2.context import RenderContext
     from liquid2.expression import Expression
 
@@ -23,28 +27,35 @@ if TYPE_CHECKING:
 class OutputNode(Node):
     """The standard output statement."""
 
-    __slots__ = ("expression",)
+    __slots__ = ("expression", "_evaluate")
 
     def __init__(self, token: TokenT, expression: Expression) -> None:
         super().__init__(token)
         self.expression = expression
+        # Bind once rather than looking up `evaluate` on every render.
+        self._evaluate = expression.evaluate
 
     def __str__(self) -> str:
         return f"`{self.expression}`"
 
     def render_to_output(self, context: RenderContext, buffer: TextIO) -> int:
         """Render the node to the output buffer."""
-        return buffer.write(
-            to_liquid_string(
-                self.expression.evaluate(context),
-                auto_escape=context.auto_escape,
-            )
-        )
+        val = self._evaluate(context)
+        auto_escape = context.auto_escape
+
+        # Strings are written as they are when we're not auto escaping.
+        if not auto_escape and isinstance(val, str):
+            return buffer.write(val)
+
+        return buffer.write(to_liquid_string(val, auto_escape=auto_escape))
 
     async def render_to_output_async(
         self, context: RenderContext, buffer: TextIO
     ) -> int:
         """Render the node to the output buffer."""
+        if self.expression.sync_only:
+            return self.render_to_output(context, buffer)
+
         return buffer.write(
             to_liquid_string(
                 await self.expression.evaluate_async(context),
@@ -67,6 +78,15 @@ class Output(Tag):
         """Parse tokens from _stream_ into an AST node."""
         token = stream.current()
         assert isinstance(token, Markup.Output)
-        return self.node_class(
-            token, FilteredExpression.parse(TokenStream(token.expression))
-        )
+        expression = FilteredExpression.parse(TokenStream(token.expression)).unwrap()
+
+        # Literals render to the same text every time, with or without auto
+        # escaping, so we output them as template content, which the parser
+        # can merge with neighbouring text. String literals evaluate to Markup
+        # when auto escaping is enabled, so they are never escaped either way.
+        if self.node_class is OutputNode and isinstance(expression, (Literal, Null)):
+            content = cast("Content", self.env.tags["__CONTENT"])
+            value = None if isinstance(expression, Null) else expression.value
+            return content.node_class(token, to_liquid_string(value))
+
+        return self.node_class(token, expression)
@@ -72,9 +72,5 @@ class AssignTag(Tag):
         name = parse_identifier(expr_stream.next())
         expr_stream.expect(Token.Assign)
         next(expr_stream)
-
-        return self.node_class(
-            token,
-            name=name,
-            expression=FilteredExpression.parse(expr_stream),
-        )
+        expression = FilteredExpression.parse(expr_stream).unwrap()
+        return self.node_class(token, name=name, expression=expression)
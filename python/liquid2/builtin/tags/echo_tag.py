@@ -64,6 +64,5 @@ class EchoTag(Tag):
         """Parse tokens from _stream_ into an AST node."""
         token = stream.current()
         assert isinstance(token, Markup.Tag)
-        return self.node_class(
-            token, FilteredExpression.parse(TokenStream(token.expression))
-        )
+        expression = FilteredExpression.parse(TokenStream(token.expression)).unwrap()
+        return self.node_class(token, expression)
@@ -296,6 +296,8 @@ class BreakNode(Node):
 class ContinueNode(Node):
     """Parse tree node for the standard _continue_ tag."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "`continue`"
 
@@ -103,17 +103,12 @@ class RenderContext:
 
     def get(self, path: Query, *, token: TokenT, default: object = UNDEFINED) -> object:
         """Resolve the variable _path_ in the current namespace."""
-        nodes = path.find(self.scope)
+        value = path.find_value(self.scope, default=default)
 
-        if not nodes:
-            if default == UNDEFINED:
-                return self.template.env.undefined(path, token=token)
-            return default
+        if value is UNDEFINED:
+            return self.template.env.undefined(path, token=token)
 
-        if len(nodes) == 1:
-            return nodes[0].value
-
-        return nodes.values()
+        return value
 
     def filter(self, name: str, *, token: TokenT) -> Callable[..., object]:
         """Return the filter callable for _name_."""
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from abc import ABC
-from abc import abstractmethod
+import warnings
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
 
 if TYPE_CHECKING:
     from liquid2 import TokenT
@@ -12,22 +13,60 @@ if TYPE_CHECKING:
     from .context import RenderContext
 
 
-class Expression(ABC):
-    """Base class for all Liquid expressions."""
+class Expression:
+    """Base class for all Liquid expressions.
+
+    Subclasses must implement `evaluate` and `children`. This is checked once,
+    when the subclass is defined, rather than on every instantiation like
+    `abc.ABC` would. Pass `abstract=True` in the class definition to skip the
+    check for intermediate base classes.
+
+    Defining a subclass that is missing either method, without passing
+    `abstract=True`, issues a `DeprecationWarning`. It will become a `TypeError`
+    in a future release.
+    """
 
     __slots__ = ("token",)
 
+    # True if this expression's async evaluation is just its sync evaluation, in
+    # which case async callers can call `evaluate` directly, avoiding a coroutine.
+    # This is set automatically for subclasses that don't override `evaluate_async`.
+    sync_only: ClassVar[bool] = True
+
+    def __init_subclass__(cls, *, abstract: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.sync_only = cls.evaluate_async is Expression.evaluate_async
+
+        if abstract:
+            return
+
+        missing = [
+            name
+            for name in ("evaluate", "children")
+            if getattr(cls, name) is getattr(Expression, name)
+        ]
+
+        if missing:
+            # While Expression was an ABC, incomplete subclasses could be defined
+            # as long as they were not instantiated, so we warn rather than raise.
+            warnings.warn(
+                f"{cls.__name__} does not implement {' and '.join(missing)}, "
+                "pass abstract=True in its class definition if it is a base class",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
     def __init__(self, token: TokenT) -> None:
         self.token = token
 
-    @abstractmethod
     def evaluate(self, context: RenderContext) -> object:
         """Evaluate the expression in the given render context."""
+        raise NotImplementedError
 
     async def evaluate_async(self, context: RenderContext) -> object:
         """An async version of `liquid.expression.Expression.evaluate`."""
         return self.evaluate(context)
 
-    @abstractmethod
     def children(self) -> list[Expression]:
         """Return a list of child expressions."""
+        raise NotImplementedError
@@ -15,6 +15,7 @@ from .tokens import TokenStream
 if TYPE_CHECKING:
     from .ast import Node
     from .environment import Environment
+    from .tag import Tag
 
 
 class Parser:
@@ -24,69 +25,121 @@ class Parser:
         self.env = env
         self.tags = env.tags
 
+    def _leaf_tags(self) -> dict[type, Tag]:
+        """Return a mapping of markup token types to non-block pseudo tags.
+
+        Tokens of these types all set the next left trim from their last
+        whitespace control marker and are then parsed by their pseudo tag.
+        """
+        tags = self.tags
+        return {
+            Markup.Comment: tags["__COMMENT"],
+            Markup.Raw: tags["__RAW"],
+            Markup.Output: tags["__OUTPUT"],
+            Markup.Lines: tags["__LINES"],
+        }
+
+    def _coalesce(self, nodes: list[Node], content: Content) -> list[Node]:
+        """Merge runs of adjacent text and raw nodes into single content nodes.
+
+        Rendering these nodes is nothing more than a write to the output buffer,
+        so one write of the concatenated text is equivalent.
+
+        A merged run becomes an instance of the content tag's node class, even
+        if it contains raw nodes, and carries the token of the run's first node.
+        A lone raw node is left as it is.
+        """
+        if len(nodes) < 2:  # noqa: PLR2004
+            return nodes
+
+        content_node = content.node_class
+        text_types = (content_node, getattr(self.tags["__RAW"], "node_class", None))
+        coalesced: list[Node] = []
+        run: list[Node] = []
+
+        for node in nodes:
+            if node.__class__ in text_types:
+                run.append(node)
+                continue
+
+            if len(run) > 1:
+                coalesced.append(
+                    content_node(run[0].token, "".join(n.text for n in run))  # type: ignore
+                )
+            else:
+                coalesced.extend(run)
+
+            run.clear()
+            coalesced.append(node)
+
+        if len(run) > 1:
+            coalesced.append(
+                content_node(run[0].token, "".join(n.text for n in run))  # type: ignore
+            )
+        else:
+            coalesced.extend(run)
+
+        return coalesced
+
     def parse(self, tokens: list[Markup]) -> list[Node]:
         """Parse _tokens_ into an abstract syntax tree."""
         tags = self.tags
-        comment = tags["__COMMENT"]
         content = cast(Content, tags["__CONTENT"])
-        output = tags["__OUTPUT"]
-        raw = tags["__RAW"]
-        lines = tags["__LINES"]
 
         nodes: list[Node] = []
         stream = TokenStream(tokens)
 
+        # Pseudo tags can be replaced in `env.tags` at any time, so we look them
+        # up once per template. Tags pass the stream on to `parse_block`, which
+        # reuses the table for every block body.
+        leaf_tags = stream.leaf_tags = self._leaf_tags()
+
         default_trim = self.env.trim
         left_trim = stream.trim_carry
         stream.trim_carry = default_trim
 
         while True:
-            match stream.current():
-                case Markup.Content():
-                    nodes.append(content.parse(stream, left_trim=left_trim))
-                    left_trim = default_trim
-                case Markup.Comment(wc):
-                    left_trim = wc[-1]
-                    nodes.append(comment.parse(stream))
-                case Markup.Raw(wc):
-                    left_trim = wc[-1]
-                    nodes.append(raw.parse(stream))
-                case Markup.Output(wc):
-                    left_trim = wc[-1]
-                    nodes.append(output.parse(stream))
-                case Markup.Tag(wc, name):
-                    left_trim = wc[-1]
-                    stream.trim_carry = left_trim
-                    try:
-                        nodes.append(tags[name].parse(stream))
-                    except KeyError as err:
-                        # TODO: change error message if name is "liquid"
-                        raise LiquidSyntaxError(
-                            f"unknown tag '{name}'", token=stream.current()
-                        ) from err
-                case Markup.Lines(wc):
-                    left_trim = wc[-1]
-                    nodes.append(lines.parse(stream))
-                case Markup.EOI() | None:
-                    break
-                case _token:
+            token = stream.current()
+            kind = token.__class__
+
+            if kind is Markup.Content:
+                nodes.append(content.parse(stream, left_trim=left_trim))
+                left_trim = default_trim
+            elif kind in leaf_tags:
+                left_trim = token.wc[-1]  # type: ignore
+                nodes.append(leaf_tags[kind].parse(stream))
+            elif kind is Markup.Tag:
+                assert isinstance(token, Markup.Tag)
+                left_trim = token.wc[-1]
+                stream.trim_carry = left_trim
+                try:
+                    nodes.append(tags[token.name].parse(stream))
+                except KeyError as err:
+                    # TODO: change error message if name is "liquid"
                     raise LiquidSyntaxError(
-                        "unexpected token '{_token.__class__.__name__}'",
-                        token=_token,
-                    )
+                        f"unknown tag '{token.name}'", token=stream.current()
+                    ) from err
+            elif token is None or isinstance(token, Markup.EOI):
+                break
+            else:
+                raise LiquidSyntaxError(
+                    f"unexpected token '{kind.__name__}'",
+                    token=token,
+                )
 
             next(stream, None)
 
-        return nodes
+        return self._coalesce(nodes, content)
 
     def parse_block(self, stream: TokenStream, end: Container[str]) -> list[Node]:
         """Parse markup tokens from _stream_ until wee find a tag in _end_."""
         tags = self.tags
-        comment = tags["__COMMENT"]
         content = cast(Content, tags["__CONTENT"])
-        output = tags["__OUTPUT"]
-        raw = tags["__RAW"]
-        lines = tags["__LINES"]
+        leaf_tags = stream.leaf_tags
+
+        if leaf_tags is None:
+            # A stream that didn't come from `parse`, like the liquid tag's.
+            leaf_tags = stream.leaf_tags = self._leaf_tags()
 
         default_trim = self.env.trim
         left_trim = stream.trim_carry
@@ -95,42 +148,36 @@ class Parser:
         nodes: list[Node] = []
 
         while True:
-            match stream.current():
-                case Markup.Content():
-                    nodes.append(content.parse(stream, left_trim=left_trim))
-                    left_trim = default_trim
-                case Markup.Comment(wc):
-                    left_trim = wc[-1]
-                    nodes.append(comment.parse(stream))
-                case Markup.Raw(wc):
-                    left_trim = wc[-1]
-                    nodes.append(raw.parse(stream))
-                case Markup.Output(wc):
-                    left_trim = wc[-1]
-                    nodes.append(output.parse(stream))
-                case Markup.Tag(wc, name):
-                    left_trim = wc[-1]
-
-                    if name in end:
-                        stream.trim_carry = left_trim
-                        break
-
-                    try:
-                        nodes.append(tags[name].parse(stream))
-                    except KeyError as err:
-                        # TODO: change error message if name is "liquid"
-                        raise LiquidSyntaxError(
-                            f"unknown tag {name}", token=stream.current()
-                        ) from err
-                case Markup.Lines(wc):
-                    left_trim = wc[-1]
-                    nodes.append(lines.parse(stream))
-                case Markup.EOI() | None:
+            token = stream.current()
+            kind = token.__class__
+
+            if kind is Markup.Content:
+                nodes.append(content.parse(stream, left_trim=left_trim))
+                left_trim = default_trim
+            elif kind in leaf_tags:
+                left_trim = token.wc[-1]  # type: ignore
+                nodes.append(leaf_tags[kind].parse(stream))
+            elif kind is Markup.Tag:
+                assert isinstance(token, Markup.Tag)
+                left_trim = token.wc[-1]
+
+                if token.name in end:
+                    stream.trim_carry = left_trim
                     break
 
+                try:
+                    nodes.append(tags[token.name].parse(stream))
+                except KeyError as err:
+                    # TODO: change error message if name is "liquid"
+                    raise LiquidSyntaxError(
+                        f"unknown tag {token.name}", token=stream.current()
+                    ) from err
+            elif token is None or isinstance(token, Markup.EOI):
+                break
+
             next(stream, None)
 
-        return nodes
+        return self._coalesce(nodes, content)
 
 
 def skip_block(stream: TokenStream, end: Container[str]) -> None:
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Iterable
 from typing import Iterator
+from typing import Mapping
+from typing import Sequence
 from typing import TypeAlias
 from typing import Union
 
@@ -42,7 +44,7 @@ class JSONPathQuery:
         segments: The `JSONPathSegment` instances that make up this query.
     """
 
-    __slots__ = ("env", "segments", "token")
+    __slots__ = ("env", "segments", "token", "_singular")
 
     def __init__(
         self,
@@ -58,6 +60,19 @@ class JSONPathQuery:
         else:
             self.token = None
 
+        # Keys and indices for queries made up of only name and index selectors,
+        # so `find_value` can resolve them without building nodes.
+        self._singular: tuple[str | int, ...] | None = None
+        if self.singular_query():
+            keys: list[str | int] = []
+            for segment in segments:
+                selector = segment.selectors[0]
+                if isinstance(selector, NameSelector):
+                    keys.append(selector.name)
+                elif isinstance(selector, IndexSelector):
+                    keys.append(selector.index)
+            self._singular = tuple(keys)
+
     def __str__(self) -> str:
         # TODO: test
         s = "".join(str(segment) for segment in self.segments)
@@ -149,6 +164,46 @@ class JSONPathQuery:
         except StopIteration:
             return None
 
+    def find_value(  # noqa: PLR0911
+        self, value: JSONValue, default: object = None
+    ) -> object:
+        """Return the value matched by this query in _value_.
+
+        Arguments:
+            value: JSON-like data to query, as you'd get from `json.load`.
+            default: The object to return if this query does not match anything.
+
+        Returns:
+            The matched value, a list of values if this query matches more than
+            one node, or _default_ if there are no matches.
+        """
+        if self._singular is None:
+            nodes = self.find(value)
+            if not nodes:
+                return default
+            if len(nodes) == 1:
+                return nodes[0].value
+            return nodes.values()
+
+        obj: object = value
+        for key in self._singular:
+            if isinstance(key, str):
+                if not isinstance(obj, Mapping):
+                    return default
+                try:
+                    obj = obj[key]
+                except KeyError:
+                    return default
+            else:
+                if not isinstance(obj, Sequence):
+                    return default
+                try:
+                    obj = obj[key]
+                except IndexError:
+                    return default
+
+        return obj
+
     def singular_query(self) -> bool:
         """Return `True` if this JSONPath expression is a singular query."""
         for segment in self.segments:
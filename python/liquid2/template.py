@@ -119,7 +119,10 @@ class Template:
         with context.extend(namespace):
             for node in self.nodes:
                 try:
-                    character_count += await node.render_async(context, buf)
+                    if node.sync_only:
+                        character_count += node.render(context, buf)
+                    else:
+                        character_count += await node.render_async(context, buf)
                 except StopRender:
                     break
                 except LiquidInterrupt as err:
@@ -18,6 +18,8 @@ from .exceptions import LiquidSyntaxError
 if TYPE_CHECKING:
     from _liquid2 import TokenT
 
+    from .tag import Tag
+
 
 class TokenStream(peekable):  # type: ignore
     """Step through or iterate a stream of tokens."""
@@ -25,6 +27,8 @@ class TokenStream(peekable):  # type: ignore
     def __init__(self, iterable: Iterable[TokenT]) -> None:
         super().__init__(iterable)
         self.trim_carry = Whitespace.Default
+        # Markup token types mapped to non-block pseudo tags, set by the parser.
+        self.leaf_tags: dict[type, Tag] | None = None
 
     def __str__(self) -> str:  # pragma: no cover
         token = self.current()
@@ -47,10 +51,11 @@ class TokenStream(peekable):  # type: ignore
 
     def current(self) -> TokenT | None:
         """Return the item at self[0] without advancing the iterator."""
-        try:
-            return self[0]  # type: ignore
-        except IndexError:
-            return None
+        # Parsers look at the current token many times before advancing.
+        # `peekable.peek` is cheaper than `peekable.__getitem__`, which has to
+        # handle slices and negative indices. We can't call `self.peek`, as
+        # we've overridden it to look one token further ahead.
+        return peekable.peek(self, None)  # type: ignore
 
     def next(self) -> TokenT | None:
         """Return the next token and advance the iterator."""
@@ -527,3 +527,51 @@ filter_test_cases = [
 def test_filter_auto_escape(case: Case) -> None:
     env = Environment(auto_escape=True)
     assert env.from_string(case.template).render(**case.context) == case.expect
+
+
+literal_output_test_cases = [
+    Case(
+        description="string literal",
+        template=r"{{ '<b>' }}",
+        context={},
+        expect="<b>",
+    ),
+    Case(
+        description="float literal",
+        template=r"{{ 1.0 }}",
+        context={},
+        expect="1.0",
+    ),
+    Case(
+        description="nil",
+        template=r"{{ nil }}",
+        context={},
+        expect="",
+    ),
+    Case(
+        description="true",
+        template=r"{{ true }}",
+        context={},
+        expect="true",
+    ),
+    Case(
+        description="literals between template content",
+        template=r"<p>{{ '<b>' }}{{ 1.0 }}{{ nil }}{{ true }}</p>",
+        context={},
+        expect="<p><b>1.0true</p>",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "case", literal_output_test_cases, ids=operator.attrgetter("description")
+)
+@pytest.mark.parametrize("auto_escape", [True, False])
+def test_literal_output(case: Case, *, auto_escape: bool) -> None:
+    # Literal output statements are parsed as template content, so the
+    # environment's auto escape setting must not change their rendered text.
+    env = Environment(auto_escape=auto_escape)
+    template = env.from_string(case.template)
+    assert template.render(**case.context) == case.expect
+    assert len(template.nodes) == 1
+    assert str(template.nodes[0]) == case.expect
@@ -0,0 +1,67 @@
+"""Test checks on subclasses of the Node and Expression base classes."""
+
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING
+from typing import TextIO
+
+import pytest
+from liquid2 import Node
+from liquid2.expression import Expression
+
+if TYPE_CHECKING:
+    from liquid2 import RenderContext
+    from liquid2.ast import MetaNode
+
+
+def test_incomplete_node_subclass_warns() -> None:
+    with pytest.warns(DeprecationWarning, match="render_to_output and children"):
+
+        class MockNode(Node):
+            pass
+
+
+def test_abstract_node_subclass() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        class MockBaseNode(Node, abstract=True):
+            pass
+
+        class MockNode(MockBaseNode):
+            def render_to_output(self, _context: RenderContext, buffer: TextIO) -> int:
+                return buffer.write("mock")
+
+            def children(self) -> list[MetaNode]:
+                return []
+
+    assert MockNode.sync_only is True
+
+
+def test_incomplete_expression_subclass_warns() -> None:
+    with pytest.warns(DeprecationWarning, match="evaluate and children"):
+
+        class MockExpression(Expression):
+            pass
+
+
+def test_abstract_expression_subclass() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        class MockBaseExpression(Expression, abstract=True):
+            pass
+
+        class MockExpression(MockBaseExpression):
+            def evaluate(self, _context: RenderContext) -> object:
+                return "mock"
+
+            async def evaluate_async(self, _context: RenderContext) -> object:
+                return "mock"
+
+            def children(self) -> list[Expression]:
+                return []
+
+    assert MockBaseExpression.sync_only is True
+    assert MockExpression.sync_only is False
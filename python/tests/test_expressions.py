@@ -0,0 +1,308 @@
+"""Expression parsing and evaluation test cases."""
+
+from __future__ import annotations
+
+import asyncio
+import operator
+from typing import Any
+from typing import NamedTuple
+
+import pytest
+from liquid2 import Environment
+from liquid2.builtin import BooleanExpression
+from liquid2.builtin import FalseLiteral
+from liquid2.builtin import FilteredExpression
+from liquid2.builtin import FloatLiteral
+from liquid2.builtin import IntegerLiteral
+from liquid2.builtin import Query
+from liquid2.builtin import StringLiteral
+from liquid2.builtin import TrueLiteral
+from liquid2.builtin.content import ContentNode
+from liquid2.builtin.expressions import LtExpression
+from liquid2.builtin.output import OutputNode
+from liquid2.builtin.tags.if_tag import IfNode
+from liquid2.exceptions import LiquidTypeError
+from test_filter import MockRecordingMapping
+
+
+class Case(NamedTuple):
+    """Table driven test case helper."""
+
+    description: str
+    template: str
+    context: dict[str, Any]
+    expect: str
+
+
+FOLDING_TEST_CASES: list[Case] = [
+    Case(
+        description="constant comparison",
+        template=r"{% if 1 == 1 %}a{% else %}b{% endif %}",
+        context={},
+        expect="a",
+    ),
+    Case(
+        description="constant logical and",
+        template=r"{% if 'a' < 'b' and 1 > 2 %}a{% else %}b{% endif %}",
+        context={},
+        expect="b",
+    ),
+    Case(
+        description="constant logical not",
+        template=r"{% if not true %}a{% else %}b{% endif %}",
+        context={},
+        expect="b",
+    ),
+    Case(
+        description="false and variable",
+        template=r"{% if false and x %}a{% else %}b{% endif %}",
+        context={"x": True},
+        expect="b",
+    ),
+    Case(
+        description="true or variable",
+        template=r"{% if true or x %}a{% else %}b{% endif %}",
+        context={"x": False},
+        expect="a",
+    ),
+    Case(
+        description="true and falsy variable",
+        template=r"{% if true and x %}a{% else %}b{% endif %}",
+        context={"x": False},
+        expect="b",
+    ),
+    Case(
+        description="true and truthy variable",
+        template=r"{% if true and x %}a{% else %}b{% endif %}",
+        context={"x": ""},
+        expect="a",
+    ),
+    Case(
+        description="false or truthy variable",
+        template=r"{% if false or x %}a{% else %}b{% endif %}",
+        context={"x": 0},
+        expect="a",
+    ),
+    Case(
+        description="ternary true condition",
+        template=r"{{ a if true else b }}",
+        context={"a": "x", "b": "y"},
+        expect="x",
+    ),
+    Case(
+        description="ternary false condition without alternative",
+        template=r"{{ a if false }}",
+        context={"a": "x"},
+        expect="",
+    ),
+    Case(
+        description="ternary false condition with filters",
+        template=r"{{ a if false else b | upcase || append: 'z' }}",
+        context={"a": "x", "b": "y"},
+        expect="Yz",
+    ),
+    Case(
+        description="ternary true condition with filters",
+        template=r"{{ a | upcase if true else b || append: 'z' }}",
+        context={"a": "x", "b": "y"},
+        expect="Xz",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "case", FOLDING_TEST_CASES, ids=operator.attrgetter("description")
+)
+def test_constant_folding(case: Case) -> None:
+    env = Environment()
+    template = env.from_string(case.template)
+    assert template.render(**case.context) == case.expect
+
+
+def _condition(template_source: str) -> object:
+    template = Environment().from_string(template_source)
+    node = template.nodes[0]
+    assert isinstance(node, IfNode)
+    return node.condition.expression
+
+
+def test_fold_constant_comparison() -> None:
+    assert isinstance(_condition(r"{% if 1 < 2 %}{% endif %}"), TrueLiteral)
+    assert isinstance(_condition(r"{% if not true %}{% endif %}"), FalseLiteral)
+
+
+def test_short_circuit_constant_left_operand() -> None:
+    assert isinstance(_condition(r"{% if false and x %}{% endif %}"), FalseLiteral)
+    assert isinstance(_condition(r"{% if true or x %}{% endif %}"), TrueLiteral)
+    assert isinstance(_condition(r"{% if true and x %}{% endif %}"), BooleanExpression)
+
+
+def test_constant_errors_are_raised_at_render_time() -> None:
+    env = Environment()
+    template = env.from_string(r"{% if 1 < 'a' %}a{% endif %}")
+    assert isinstance(_condition(r"{% if 1 < 'a' %}a{% endif %}"), LtExpression)
+
+    with pytest.raises(LiquidTypeError):
+        template.render()
+
+
+def _output_expression(template_source: str) -> object:
+    template = Environment().from_string(template_source)
+    node = template.nodes[0]
+    assert isinstance(node, OutputNode)
+    return node.expression
+
+
+def test_fold_ternary_true_condition() -> None:
+    expr = _output_expression(r"{{ a if true else b }}")
+    assert isinstance(expr, Query)
+    assert str(expr) == "a"
+
+
+def test_fold_ternary_false_condition_without_alternative() -> None:
+    # The selected branch is nil, which is output as template content.
+    template = Environment().from_string(r"{{ a if false }}")
+    assert len(template.nodes) == 1
+    assert isinstance(template.nodes[0], ContentNode)
+    assert str(template.nodes[0]) == ""
+
+
+def test_fold_ternary_filters() -> None:
+    expr = _output_expression(r"{{ a if false else b | upcase || downcase }}")
+    assert isinstance(expr, FilteredExpression)
+    assert isinstance(expr.left, Query)
+    assert str(expr.left) == "b"
+    assert [f.name for f in expr.filters or []] == ["upcase", "downcase"]
+
+    # Filters on the selected branch come before tail filters, without nesting
+    # one FilteredExpression inside another.
+    expr = _output_expression(r"{{ a | upcase if true else b || downcase }}")
+    assert isinstance(expr, FilteredExpression)
+    assert isinstance(expr.left, Query)
+    assert [f.name for f in expr.filters or []] == ["upcase", "downcase"]
+
+
+class LogicalCase(NamedTuple):
+    """Table driven test case helper for chains of logical operators."""
+
+    description: str
+    condition: str
+    data: dict[str, object]
+    expect: str
+    keys_seen: list[str]
+
+
+LOGICAL_TEST_CASES: list[LogicalCase] = [
+    LogicalCase(
+        description="and chain, all truthy",
+        condition="d.a and d.b and d.c",
+        data={"a": 1, "b": 2, "c": 3},
+        expect="yes",
+        keys_seen=["a", "b", "c"],
+    ),
+    LogicalCase(
+        description="and chain, stop at first falsy",
+        condition="d.a and d.b and d.c",
+        data={"a": 1, "b": False, "c": 3},
+        expect="no",
+        keys_seen=["a", "b"],
+    ),
+    LogicalCase(
+        description="and chain, last operand falsy",
+        condition="d.a and d.b and d.c",
+        data={"a": 1, "b": 2, "c": None},
+        expect="no",
+        keys_seen=["a", "b", "c"],
+    ),
+    LogicalCase(
+        description="or chain, stop at first truthy",
+        condition="d.a or d.b or d.c",
+        data={"a": False, "b": 0, "c": None},
+        expect="yes",
+        keys_seen=["a", "b"],
+    ),
+    LogicalCase(
+        description="or chain, all falsy",
+        condition="d.a or d.b or d.c",
+        data={"a": False, "b": None, "c": False},
+        expect="no",
+        keys_seen=["a", "b", "c"],
+    ),
+    LogicalCase(
+        description="and binds more tightly than or",
+        condition="d.a and d.b or d.c",
+        data={"a": False, "b": True, "c": True},
+        expect="yes",
+        keys_seen=["a", "c"],
+    ),
+    LogicalCase(
+        description="or with an and chain on the right",
+        condition="d.a or d.b and d.c and d.e",
+        data={"a": False, "b": True, "c": False, "e": True},
+        expect="no",
+        keys_seen=["a", "b", "c"],
+    ),
+    LogicalCase(
+        description="or chain of and chains",
+        condition="d.a and d.b or d.c and d.e or d.f",
+        data={"a": True, "b": False, "c": True, "e": True, "f": True},
+        expect="yes",
+        keys_seen=["a", "b", "c", "e"],
+    ),
+    LogicalCase(
+        description="grouped or inside an and chain",
+        condition="d.a and (d.b or d.c) and d.e",
+        data={"a": True, "b": False, "c": True, "e": False},
+        expect="no",
+        keys_seen=["a", "b", "c", "e"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "case", LOGICAL_TEST_CASES, ids=operator.attrgetter("description")
+)
+def test_logical_chains(case: LogicalCase) -> None:
+    env = Environment()
+    template = env.from_string(
+        f"{{% if {case.condition} %}}yes{{% else %}}no{{% endif %}}"
+    )
+
+    data = MockRecordingMapping(case.data)
+    assert template.render(d=data) == case.expect
+    assert data.keys_seen == case.keys_seen
+
+    async def coro() -> str:
+        return await template.render_async(d=async_data)
+
+    async_data = MockRecordingMapping(case.data)
+    assert asyncio.run(coro()) == case.expect
+    assert async_data.keys_seen == case.keys_seen
+
+
+# Literal equality doesn't look at tokens.
+TOKEN: Any = None
+
+
+def test_literal_equality() -> None:
+    assert FalseLiteral(TOKEN) == FalseLiteral(TOKEN)
+    assert TrueLiteral(TOKEN) == TrueLiteral(TOKEN)
+    assert TrueLiteral(TOKEN) != FalseLiteral(TOKEN)
+    assert IntegerLiteral(TOKEN, 1) == IntegerLiteral(TOKEN, 1)
+    assert IntegerLiteral(TOKEN, 1) != IntegerLiteral(TOKEN, 2)
+    assert StringLiteral(TOKEN, "a") == StringLiteral(TOKEN, "a")
+    assert hash(FalseLiteral(TOKEN)) == hash(FalseLiteral(TOKEN))
+
+
+def test_literals_of_different_types_are_not_equal() -> None:
+    assert IntegerLiteral(TOKEN, 1) != FloatLiteral(TOKEN, 1.0)
+    assert FloatLiteral(TOKEN, 1.0) != IntegerLiteral(TOKEN, 1)
+    assert IntegerLiteral(TOKEN, 1) != TrueLiteral(TOKEN)
+    assert TrueLiteral(TOKEN) != IntegerLiteral(TOKEN, 1)
+
+
+def test_literals_are_not_equal_to_raw_values() -> None:
+    assert IntegerLiteral(TOKEN, 1) != 1
+    assert StringLiteral(TOKEN, "a") != "a"
+    assert FalseLiteral(TOKEN) != False  # noqa: E712
+    assert TrueLiteral(TOKEN) != True  # noqa: E712
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import Any
+from typing import Iterator
+from typing import Mapping
 
 import pytest
 from liquid2 import DUMMY_TOKEN
 from liquid2 import Environment
+from liquid2 import RenderContext
+from liquid2.builtin import Filter
+from liquid2.builtin import FilteredExpression
+from liquid2.builtin.output import OutputNode
 from liquid2.exceptions import LiquidTypeError
 from liquid2.filter import int_arg
 from liquid2.filter import with_context
 from liquid2.query import from_symbol
 
-if TYPE_CHECKING:
-    from liquid2.context import RenderContext
-
 
 @with_context
 def mock_filter(val: str, arg: str, *, context: RenderContext) -> str:
@@ -39,5 +43,77 @@ def test_int_arg_sting_value_error_with_default() -> None:
     assert int_arg("foo", default=42) == 42  # noqa: PLR2004
 
 
+class MockRecordingMapping(Mapping[str, object]):
+    """Mock mapping recording the order in which its keys are looked up."""
+
+    def __init__(self, data: dict[str, object]) -> None:
+        self.data = data
+        self.keys_seen: list[str] = []
+
+    def __getitem__(self, key: str) -> object:
+        self.keys_seen.append(key)
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+def mock_args_filter(val: str, *args: object, **kwargs: Any) -> str:
+    """Mock filter function accepting any arguments."""
+    return val + "".join(str(arg) for arg in args) + "".join(kwargs)
+
+
+def test_arguments_are_evaluated_in_source_order() -> None:
+    env = Environment()
+    env.filters["mock"] = mock_args_filter
+    template = env.from_string(r"{{ 'x' | mock: d.a, k: d.b, d.c }}")
+    data = MockRecordingMapping({"a": 1, "b": 2, "c": 3})
+    assert template.render(d=data) == "x13k"
+    assert data.keys_seen == ["a", "b", "c"]
+
+
+def test_filter_to_string() -> None:
+    env = Environment()
+    template = env.from_string(
+        r"{{ x | upcase | slice: 1, 2 | truncate: 5, end: '..' }}"
+    )
+    node = template.nodes[0]
+    assert isinstance(node, OutputNode)
+    assert isinstance(node.expression, FilteredExpression)
+    assert node.expression.filters is not None
+    assert [str(f) for f in node.expression.filters] == [
+        "upcase",
+        "slice: 1, 2",
+        "truncate: 5, end: '..'",
+    ]
+
+
+def test_evaluate_filter_arguments() -> None:
+    env = Environment()
+    template = env.from_string(
+        r"{{ x | upcase | slice: 1, 2 | truncate: a, end: b, c }}"
+    )
+    node = template.nodes[0]
+    assert isinstance(node, OutputNode)
+    assert isinstance(node.expression, FilteredExpression)
+    assert node.expression.filters is not None
+    upcase, slice_, truncate = node.expression.filters
+    context = RenderContext(template, global_data={"a": 5, "b": "..", "c": 3})
+
+    async def coro(filter_: Filter) -> tuple[list[object], Mapping[str, object]]:
+        return await filter_.evaluate_args_async(context)
+
+    for filter_, expect in [
+        (upcase, ([], {})),
+        (slice_, ([1, 2], {})),
+        (truncate, ([5, 3], {"end": ".."})),
+    ]:
+        assert filter_.evaluate_args(context) == expect
+        assert asyncio.run(coro(filter_)) == expect
+
+
 # TODO: more tests following implicit conversion rules
 # TODO: undefined args
@@ -0,0 +1,185 @@
+"""Test that JSONPathQuery.find_value agrees with JSONPathQuery.find."""
+
+from __future__ import annotations
+
+import operator
+from typing import Any
+from typing import NamedTuple
+
+import pytest
+from liquid2.query import DEFAULT_ENV
+from liquid2.query import JSONValue
+from liquid2.query import Query
+from liquid2.query.segments import JSONPathChildSegment
+from liquid2.query.segments import JSONPathRecursiveDescentSegment
+from liquid2.query.segments import JSONPathSegment
+from liquid2.query.selectors import IndexSelector
+from liquid2.query.selectors import JSONPathSelector
+from liquid2.query.selectors import NameSelector
+from liquid2.query.selectors import WildcardSelector
+
+# Selectors and segments only use their token for error messages.
+TOKEN: Any = None
+
+
+def _selector(key: str | int | None) -> JSONPathSelector:
+    if key is None:
+        return WildcardSelector(env=DEFAULT_ENV, token=TOKEN)
+    if isinstance(key, str):
+        return NameSelector(env=DEFAULT_ENV, token=TOKEN, name=key)
+    return IndexSelector(env=DEFAULT_ENV, token=TOKEN, index=key)
+
+
+def _query(*keys: str | int | None, descend: bool = False) -> Query:
+    """Return a query made of one child segment per key.
+
+    A key of `None` is a wildcard selector. If _descend_ is true, the first
+    segment is a recursive descent segment.
+    """
+    segments: list[JSONPathSegment] = [
+        JSONPathChildSegment(env=DEFAULT_ENV, token=TOKEN, selectors=(_selector(key),))
+        for key in keys
+    ]
+
+    if descend and segments:
+        segments[0] = JSONPathRecursiveDescentSegment(
+            env=DEFAULT_ENV, token=TOKEN, selectors=segments[0].selectors
+        )
+
+    return Query(env=DEFAULT_ENV, segments=tuple(segments))
+
+
+class Case(NamedTuple):
+    """Table driven test case helper."""
+
+    description: str
+    query: Query
+    data: JSONValue
+    singular: bool
+
+
+TEST_CASES = [
+    Case(
+        description="name",
+        query=_query("a"),
+        data={"a": 1},
+        singular=True,
+    ),
+    Case(
+        description="nested names",
+        query=_query("a", "b"),
+        data={"a": {"b": [1, 2]}},
+        singular=True,
+    ),
+    Case(
+        description="missing key",
+        query=_query("a", "c"),
+        data={"a": {"b": 1}},
+        singular=True,
+    ),
+    Case(
+        description="name of an array",
+        query=_query("a", "b"),
+        data={"a": [1, 2]},
+        singular=True,
+    ),
+    Case(
+        description="name of a string",
+        query=_query("a", "b"),
+        data={"a": "bar"},
+        singular=True,
+    ),
+    Case(
+        description="index",
+        query=_query("a", 1),
+        data={"a": [1, 2, 3]},
+        singular=True,
+    ),
+    Case(
+        description="negative index",
+        query=_query("a", -1),
+        data={"a": [1, 2, 3]},
+        singular=True,
+    ),
+    Case(
+        description="negative index out of range",
+        query=_query("a", -4),
+        data={"a": [1, 2, 3]},
+        singular=True,
+    ),
+    Case(
+        description="index out of range",
+        query=_query("a", 3),
+        data={"a": [1, 2, 3]},
+        singular=True,
+    ),
+    Case(
+        description="index of a string",
+        query=_query("a", 0),
+        data={"a": "bar"},
+        singular=True,
+    ),
+    Case(
+        description="negative index of a string",
+        query=_query("a", -1),
+        data={"a": "bar"},
+        singular=True,
+    ),
+    Case(
+        description="index of an object",
+        query=_query("a", 0),
+        data={"a": {"0": "b"}},
+        singular=True,
+    ),
+    Case(
+        description="index of nil",
+        query=_query("a", 0),
+        data={"a": None},
+        singular=True,
+    ),
+    Case(
+        description="wildcard, many matches",
+        query=_query("a", None),
+        data={"a": [1, 2, 3]},
+        singular=False,
+    ),
+    Case(
+        description="wildcard, one match",
+        query=_query("a", None),
+        data={"a": [1]},
+        singular=False,
+    ),
+    Case(
+        description="wildcard, no matches",
+        query=_query("a", None),
+        data={"a": []},
+        singular=False,
+    ),
+    Case(
+        description="recursive descent",
+        query=_query("b", descend=True),
+        data={"a": {"b": 1}, "c": [{"b": 2}]},
+        singular=False,
+    ),
+]
+
+
+@pytest.mark.parametrize("case", TEST_CASES, ids=operator.attrgetter("description"))
+def test_find_value(case: Case) -> None:
+    default = object()
+    values = case.query.find(case.data).values()
+
+    if not values:
+        expect: object = default
+    elif len(values) == 1:
+        expect = values[0]
+    else:
+        expect = values
+
+    assert case.query.singular_query() is case.singular
+    assert case.query.find_value(case.data, default) == expect
+
+
+def test_find_value_default() -> None:
+    assert _query("a").find_value({}) is None
+    assert _query("a", None).find_value({"a": []}) is None
@@ -0,0 +1,107 @@
+"""Parser test cases."""
+
+from typing import TextIO
+
+from liquid2 import Environment
+from liquid2 import RenderContext
+from liquid2.builtin.comments import CommentNode
+from liquid2.builtin.content import ContentNode
+from liquid2.builtin.output import Output
+from liquid2.builtin.output import OutputNode
+from liquid2.builtin.tags.if_tag import IfNode
+from liquid2.builtin.tags.raw_tag import RawNode
+
+
+def test_merge_content_and_raw_nodes() -> None:
+    env = Environment()
+    template = env.from_string("a{% raw %}{{ b }}{% endraw %}c")
+
+    assert len(template.nodes) == 1
+    node = template.nodes[0]
+    assert isinstance(node, ContentNode)
+    assert node.text == "a{{ b }}c"
+    # The merged node carries the token of the first node in the run.
+    assert node.token.span[0] == 0  # type: ignore
+    assert template.render() == "a{{ b }}c"
+
+
+def test_merge_runs_between_other_nodes() -> None:
+    env = Environment()
+    template = env.from_string("a{{ x }}b{% raw %}c{% endraw %}d{{ y }}")
+
+    assert [node.__class__ for node in template.nodes] == [
+        ContentNode,
+        OutputNode,
+        ContentNode,
+        OutputNode,
+    ]
+    assert str(template.nodes[2]) == "bcd"
+    assert template.render(x="X", y="Y") == "aXbcdY"
+
+
+def test_lone_raw_node_is_not_converted() -> None:
+    env = Environment()
+    template = env.from_string("{{ x }}{% raw %}{{ a }}{% endraw %}{{ y }}")
+
+    assert [node.__class__ for node in template.nodes] == [
+        OutputNode,
+        RawNode,
+        OutputNode,
+    ]
+
+
+def test_comments_are_not_merged() -> None:
+    env = Environment()
+    template = env.from_string("a{# note #}b")
+
+    assert [node.__class__ for node in template.nodes] == [
+        ContentNode,
+        CommentNode,
+        ContentNode,
+    ]
+    assert template.render() == "ab"
+
+
+def test_merge_runs_in_block_bodies() -> None:
+    env = Environment()
+    template = env.from_string(
+        "{% if x %}a{% raw %}b{% endraw %}c{% else %}d{% raw %}e{% endraw %}{% endif %}"
+    )
+
+    assert len(template.nodes) == 1
+    node = template.nodes[0]
+    assert isinstance(node, IfNode)
+
+    assert [n.__class__ for n in node.consequence.nodes] == [ContentNode]
+    assert str(node.consequence.nodes[0]) == "abc"
+
+    assert node.default is not None
+    assert [n.__class__ for n in node.default.nodes] == [ContentNode]
+    assert str(node.default.nodes[0]) == "de"
+
+    assert template.render(x=True) == "abc"
+    assert template.render(x=False) == "de"
+
+
+class MockOutputNode(OutputNode):
+    """Mock output node that ignores its expression."""
+
+    def render_to_output(self, _context: RenderContext, buffer: TextIO) -> int:
+        """Render the node to the output buffer."""
+        return buffer.write("mock")
+
+
+class MockOutput(Output):
+    """Mock output statement pseudo tag."""
+
+    node_class = MockOutputNode
+
+
+def test_replace_pseudo_tag_after_parsing() -> None:
+    env = Environment()
+    source = "{{ x }}{% if x %}{{ x }}{% endif %}"
+    assert env.from_string(source).render(x="a") == "aa"
+
+    # Pseudo tags are looked up once per template, not once per parser.
+    env.tags["__OUTPUT"] = MockOutput(env)
+    assert env.from_string(source).render(x="a") == "mockmock"
@@ -196,6 +196,30 @@ def test_analyze_ternary_filters(env: Environment) -> None:
     )
 
 
+def test_analyze_constant_ternary_condition(env: Environment) -> None:
+    # The condition and the branch that can't be selected are dropped at
+    # parse time, so they are not reported.
+    _assert(
+        env.from_string(r"{{ a if false else b | upcase || downcase }}"),
+        local_refs={},
+        global_refs={"b": _Span(19, 20)},
+        filters={
+            "upcase": _Span(23, 29),
+            "downcase": _Span(33, 41),
+        },
+    )
+
+    _assert(
+        env.from_string(r"{{ a | upcase if true else b || downcase }}"),
+        local_refs={},
+        global_refs={"a": _Span(3, 4)},
+        filters={
+            "upcase": _Span(7, 13),
+            "downcase": _Span(32, 40),
+        },
+    )
+
+
 def test_analyze_assign(env: Environment) -> None:
     source = r"{% assign x = y | append: z %}"
 
@@ -363,6 +387,24 @@ def test_analyze_if(env: Environment) -> None:
     )
 
 
+def test_analyze_short_circuited_operands(env: Environment) -> None:
+    source = r"{% if false and x %}{{ a }}{% endif %}{% if true and y %}{% endif %}"
+
+    # `x` can never be evaluated, so it is not reported.
+    _assert(
+        env.from_string(source),
+        local_refs={},
+        global_refs={
+            "a": _Span(23, 24),
+            "y": _Span(53, 54),
+        },
+        filters={},
+        tags={
+            "if": [_Span(0, 20), _Span(38, 57)],
+        },
+    )
+
+
 def test_analyze_increment(env: Environment) -> None:
     source = r"{% increment x %}"
 
@@ -0,0 +1,66 @@
+"""TokenStream test cases."""
+
+from typing import Any
+
+from liquid2.tokens import TokenStream
+
+# TokenStream doesn't inspect the items it holds, so we use strings as tokens.
+A: Any = "a"
+B: Any = "b"
+C: Any = "c"
+X: Any = "x"
+Y: Any = "y"
+TOKENS = [A, B, C]
+
+
+def test_current_and_peek() -> None:
+    stream = TokenStream(TOKENS)
+    assert stream.current() == A
+    assert stream.peek() == B
+    assert stream.current() == A
+
+    assert stream.next() == A
+    assert stream.current() == B
+    assert stream.peek() == C
+
+    assert stream.next() == B
+    assert stream.current() == C
+    assert stream.peek() is None
+
+    assert stream.next() == C
+    assert stream.current() is None
+    assert stream.peek() is None
+    assert stream.next() is None
+
+
+def test_peek_before_current() -> None:
+    stream = TokenStream(TOKENS)
+    assert stream.peek() == B
+    assert stream.current() == A
+    assert stream.next() == A
+    assert stream.current() == B
+
+
+def test_push_and_prepend() -> None:
+    stream = TokenStream(TOKENS)
+    assert stream.next() == A
+
+    stream.push(A)
+    assert stream.current() == A
+    assert stream.peek() == B
+
+    stream.prepend(X, Y)
+    assert stream.current() == X
+    assert stream.peek() == Y
+    assert [stream.next() for _ in range(5)] == [X, Y, A, B, C]
+    assert stream.current() is None
+
+
+def test_push_onto_exhausted_stream() -> None:
+    stream = TokenStream(TOKENS[:1])
+    assert stream.next() == A
+    assert stream.current() is None
+
+    stream.push(B)
+    assert stream.current() == B
+    assert stream.peek() is None